@@ -1,71 +1,116 @@
 import os
 import re
-import fnmatch
-import xml.etree.ElementTree as ET
-import pandas as pd
-from bs4 import BeautifulSoup
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill
+import sys
+import functools
+import itertools
+from collections import defaultdict, deque, namedtuple
+from pathlib import Path
+from lxml import etree as ET
+from lxml import html as lh
+import xlsxwriter
+
+# Excel column headers, in output order; extracted rows are Row tuples in this order,
+# with each field named after its header (Object Name -> object_name)
+COLUMNS = (
+    'Object Name', 'Parameter Name', 'Full Path',
+    'Description', 'Data Type', 'Object Default', 'Is Object',
+    'Access', 'Version'
+)
+Row = namedtuple('Row', [column.lower().replace(' ', '_') for column in COLUMNS])
+
+# Namespace used by the data model's qualified elements
+DM_NAMESPACE = 'urn:broadband-forum-org:cwmp:datamodel-1-14'
+DM_DESCRIPTION = ET.QName(DM_NAMESPACE, 'description').text
+
+@functools.lru_cache(maxsize=256)
+def _localname(tag):
+    """Lower-cased tag name without its namespace; tags repeat, so results are cached."""
+    return tag.rsplit('}', 1)[-1].lower()
+
+# Lower-cased syntax type names: integer types, types formatted with a size/range
+# facet, and integer types whose ranges are shown in square brackets
+_NUMERIC_TYPES = frozenset({"int", "unsignedint", "long", "unsignedlong"})
+_SIZED_TYPES = _NUMERIC_TYPES | {"string"}
+_BRACKETED_RANGE_TYPES = frozenset({"int", "long", "unsignedint"})
+
+# Primitive syntax tags, in the order walk_base_chain prefers them
+_PRIMITIVE_TAGS = ("string", "int", "unsignedInt", "unsignedLong", "hexBinary", "dateTime", "boolean", "list")
+
+def _format_bounds(lower, upper):
+    """Format a size/range pair as 'min:max', 'min:' or 'max'; None when neither is set."""
+    if lower and upper:
+        return f"{lower}:{upper}"
+    if lower:
+        return f"{lower}:"
+    if upper:
+        return f"{upper}"
+    return None
+
+# Resolved type strings keyed by dataType name; reset for each XML file
+_datatype_cache = {}
 
-# --- Helper function to resolve dataType references recursively ---
-def resolve_datatype_reference(datatype_name, xml_root, visited=None):
+# --- Helper function to resolve dataType references ---
+def resolve_datatype_reference(datatype_name, datatype_index, visited=None):
     """
-    Recursively resolve a dataType reference, extracting type and size/range information.
-    Walks up the <dataType> base chain until a concrete type (string, int, unsignedInt) is found,
-    even if inheritance is multi-level.
+    Resolve a dataType reference, extracting type and size/range information.
+    Walks up the <dataType> base chain in a loop until a concrete type (string, int,
+    unsignedInt) is found, even if inheritance is multi-level.
+
+    datatype_index maps each <dataType> name to its element.
+    Top-level results are memoized in _datatype_cache; the only nested call is the
+    one that fills the cache.
     """
     if visited is None:
-        visited = set()
+        if datatype_name not in _datatype_cache:
+            _datatype_cache[datatype_name] = resolve_datatype_reference(datatype_name, datatype_index, set())
+        return _datatype_cache[datatype_name]
     if datatype_name in visited:
         return None
     visited.add(datatype_name)
 
     # Find the datatype element with the given name
-    dt_elem = None
-    for dt in xml_root.findall(".//dataType"):
-        if dt.get("name") == datatype_name:
-            dt_elem = dt
-            break
+    dt_elem = datatype_index.get(datatype_name)
     if dt_elem is None:
         return None
 
     # Helper for extracting type and size/range/enumeration from primitive type elements
     def extract_type_info(elem):
-        tag_name = elem.tag.lower().split('}')[-1]
-        tag_name_norm = tag_name.lower()
+        tag_name_norm = _localname(elem.tag)
 
-        # Collect all <size> tags (for types like hexBinary, string, etc.)
+        # Single pass over the children: <size> tags (for types like hexBinary, string, etc.),
+        # the first <range> tag and any <enumeration> values
         size_ranges = []
-        for size_elem in elem.findall("size"):
-            min_len = size_elem.get("minLength")
-            max_len = size_elem.get("maxLength")
-            if min_len and max_len:
-                size_ranges.append(f"{min_len}:{max_len}")
-            elif min_len:
-                size_ranges.append(f"{min_len}:")
-            elif max_len:
-                size_ranges.append(f"{max_len}")
+        range_elem = None
+        enum_values = []
+        only_enums = True
+        for child in elem:
+            tag = child.tag
+            if tag == "size":
+                bounds = _format_bounds(child.get("minLength"), child.get("maxLength"))
+                if bounds:
+                    size_ranges.append(bounds)
+            elif tag == "range":
+                if range_elem is None:
+                    range_elem = child
+            elif tag == "enumeration":
+                value = child.get("value")
+                if value is not None:
+                    enum_values.append(value)
+            if only_enums and _localname(tag) != "enumeration":
+                only_enums = False
 
         # Handle <range> tag if present
-        range_elem = elem.find("range")
         if range_elem is not None:
-            min_val = range_elem.get("minInclusive")
-            max_val = range_elem.get("maxInclusive")
-            if min_val and max_val:
-                size_ranges.append(f"{min_val}:{max_val}")
-            elif min_val:
-                size_ranges.append(f"{min_val}:")
-            elif max_val:
-                size_ranges.append(f"{max_val}")
+            bounds = _format_bounds(range_elem.get("minInclusive"), range_elem.get("maxInclusive"))
+            if bounds:
+                size_ranges.append(bounds)
 
         # Combine size/range into string with special handling for int, long, unsignedint
-        if tag_name_norm in ["int", "long", "unsignedint"]:
+        if tag_name_norm in _BRACKETED_RANGE_TYPES:
             size_range_str = f"[{', '.join(size_ranges)}]" if size_ranges else ""
         else:
             size_range_str = f"({', '.join(size_ranges)})" if size_ranges else ""
 
-        enums = elem.findall("enumeration")
-        enum_values = [e.get("value") for e in enums if e.get("value") is not None]
         enum_str = ",".join(enum_values) if enum_values else None
 
         # Compose base type
@@ -73,7 +118,7 @@ def resolve_datatype_reference(datatype_name, xml_root, visited=None):
         # If enumeration present, treat as enum type only if string has other content
         if enum_values:
             # If the type is 'string' and all children are <enumeration>, show just 'string'
-            if tag_name_norm == "string" and all(child.tag.lower().split('}')[-1] == "enumeration" for child in elem):
+            if tag_name_norm == "string" and only_enums:
                 base = "string"
                 enum_values = []  # Suppress enum output for pure enum cases
             else:
@@ -87,127 +132,155 @@ def resolve_datatype_reference(datatype_name, xml_root, visited=None):
             type_str += f"[{enum_str}]"
         return type_str
 
-    # Recursive base chain traversal to resolve ultimate type and size/range/enumeration
-    def walk_base_chain(elem, xml_root, visited):
-        # Look for any child that defines a type (primitive or otherwise)
-        for child in elem:
-            tag_name = child.tag.lower().split('}')[-1]
-            # Ignore known non-type tags
-            if tag_name in ['description']:
-                continue
-            # Apply extract_type_info to any child element
-            type_info = extract_type_info(child)
-            if type_info:
-                return type_info
-        # Fallback: look for primitive tags anywhere under elem
-        for tag in ["string", "int", "unsignedInt", "unsignedLong", "hexBinary", "dateTime", "boolean", "list"]:
-            syntax_elem = elem.find(".//" + tag)
-            if syntax_elem is not None:
-                type_info = extract_type_info(syntax_elem)
-                if type_info:
-                    return type_info
-        # Also check for enumeration in this element
-        enums = elem.findall("enumeration")
-        if enums:
-            enum_values = [e.get("value") for e in enums if e.get("value") is not None]
-            enum_str = ",".join(enum_values)
-            return f"enum[{enum_str}]"
-        # Also check for <size> and <range> tags directly on this element, and combine
-        size_ranges = []
-        for size_elem in elem.findall("size"):
-            min_len = size_elem.get("minLength")
-            max_len = size_elem.get("maxLength")
-            if min_len and max_len:
-                size_ranges.append(f"{min_len}:{max_len}")
-            elif min_len:
-                size_ranges.append(f"{min_len}:")
-            elif max_len:
-                size_ranges.append(f"{max_len}")
-        range_elem = elem.find("range")
-        if range_elem is not None:
-            min_val = range_elem.get("minInclusive")
-            max_val = range_elem.get("maxInclusive")
-            if min_val and max_val:
-                size_ranges.append(f"{min_val}:{max_val}")
-            elif min_val:
-                size_ranges.append(f"{min_val}:")
-            elif max_val:
-                size_ranges.append(f"{max_val}")
-        # Define tag_name_norm before using it below
-        tag_name_norm = elem.tag.lower().split('}')[-1]
-        if tag_name_norm in ["int", "long", "unsignedint"]:
-            size_range_str = f"[{', '.join(size_ranges)}]" if size_ranges else ""
-        else:
-            size_range_str = f"({', '.join(size_ranges)})" if size_ranges else ""
-        if size_range_str:
-            return f"{tag_name_norm}{size_range_str}"
-        # Walk up the base chain recursively
-        base = elem.get("base")
-        if base and base not in visited:
+    # Base chain traversal to resolve ultimate type and size/range/enumeration
+    def walk_base_chain(elem, datatype_index, visited):
+        while elem is not None:
+            # The first child that is not a <description> defines the type; while scanning,
+            # remember the first primitive tag of each kind nested anywhere below elem
+            nested_primitives = {}
+            for child in elem:
+                tag_name = _localname(child.tag)
+                if tag_name != 'description':
+                    return extract_type_info(child)
+                for nested in child.iter():
+                    if nested.tag in _PRIMITIVE_TAGS:
+                        nested_primitives.setdefault(nested.tag, nested)
+            # Fallback: primitive tags found anywhere under elem, in priority order
+            for tag in _PRIMITIVE_TAGS:
+                if tag in nested_primitives:
+                    return extract_type_info(nested_primitives[tag])
+            # Move up the base chain, stopping at a cycle or an unknown base
+            base = elem.get("base")
+            if not base or base in visited:
+                return None
             visited.add(base)
-            parent_elem = None
-            for dt in xml_root.findall(".//dataType"):
-                if dt.get("name") == base:
-                    parent_elem = dt
-                    break
-            if parent_elem is not None:
-                return walk_base_chain(parent_elem, xml_root, visited)
+            elem = datatype_index.get(base)
         return None
 
-    # Try to resolve type recursively
-    resolved_type = walk_base_chain(dt_elem, xml_root, visited)
+    # Try to resolve type through the base chain
+    resolved_type = walk_base_chain(dt_elem, datatype_index, visited)
     if resolved_type:
         return resolved_type
 
     # As fallback, try to infer type from any child that might define a type
     for child in dt_elem:
-        tag_name = child.tag.lower().split('}')[-1]
-        if tag_name not in ['description']:
+        tag_name = _localname(child.tag)
+        if tag_name != 'description':
             type_info = extract_type_info(child)
             if type_info:
                 return type_info
     # As fallback, return None
     return None
 
+def _iterparse(xml_file_path, tag):
+    """
+    Stream start/end events for the given tags. Comments and PIs are dropped to keep
+    the element-only view the extractors expect; whitespace-only text is kept, since
+    it separates inline markup in descriptions.
+    """
+    return ET.iterparse(xml_file_path, events=('start', 'end'), tag=tag,
+                        collect_ids=False, huge_tree=True,
+                        remove_comments=True, remove_pis=True)
+
+def _is_top_level(elem):
+    """True if elem is a direct child of the document root."""
+    parent = elem.getparent()
+    return parent is not None and parent.getparent() is None
+
+def _release(elem):
+    """Free a processed element together with the already-processed siblings before it."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None and _localname(parent.tag) == 'model':
+        while elem.getprevious() is not None:
+            del parent[0]
+
+@functools.lru_cache(maxsize=65536)
 def normalize_path(path):
-    """Normalize a parameter path for comparison."""
-    return path.lower().replace(" ", "").strip(".")
+    """
+    Normalize a parameter path for comparison (cached; cleared per XML file).
+    Results are interned so description lookups compare keys by identity.
+    """
+    return sys.intern(path.lower().replace(" ", "").strip("."))
+
+def relax_descriptions(html_descriptions):
+    """
+    Re-key normalized descriptions with {i} placeholders removed, for matching
+    paths that differ only in their placeholders. The first key in insertion order wins.
+    """
+    relaxed = {}
+    for key, description in html_descriptions.items():
+        relaxed.setdefault(key.replace("{i}", ""), description)
+    return relaxed
+
+# Precompiled pattern for description processing
+_WS_RE = re.compile(r"\s+")
+
+def _expand_macros(text, replace):
+    """
+    Replace each {{...}} macro in text with replace(macro_body), scanning with str.find.
+    Each macro is the shortest {{...}} that does not span a line break
+    (the same matches as the pattern r"\{\{(.*?)\}\}").
+    """
+    parts = []
+    copied = 0
+    start = text.find("{{")
+    while start >= 0:
+        end = text.find("}}", start + 2)
+        if end < 0:
+            break
+        macro = text[start + 2:end]
+        if "\n" in macro:
+            # Not a macro on this line; try again from the next brace
+            start = text.find("{{", start + 1)
+            continue
+        parts.append(text[copied:start])
+        parts.append(replace(macro))
+        copied = end + 2
+        start = text.find("{{", copied)
+    parts.append(text[copied:])
+    return "".join(parts)
+
+def _numentries_macro(arg, param_name, object_path):
+    if param_name and param_name.endswith("NumberOfEntries"):
+        table = param_name.replace("NumberOfEntries", "")
+        full_table = f"{object_path}{table}" if object_path else table
+        return f"The number of entries in the {full_table} table."
+    return "The number of entries."
+
+def _reference_macro(arg, param_name, object_path):
+    return arg.replace("{{object}}", object_path.rstrip('.') if object_path else "this object")
+
+# Macros written without an argument, e.g. {{empty}}
+_PLAIN_MACROS = {
+    "numentries": _numentries_macro,
+    "empty": lambda arg, param_name, object_path: "an empty string",
+    "pattern": lambda arg, param_name, object_path: "a valid value matching the required pattern",
+    "reference": lambda arg, param_name, object_path: "",
+    "referenceName": lambda arg, param_name, object_path: "",
+    "noreference": lambda arg, param_name, object_path: "",
+}
+
+# Macros written as {{name|argument}}
+_ARG_MACROS = {
+    "param": lambda arg, param_name, object_path: arg,
+    "object": lambda arg, param_name, object_path: arg,
+    "bibref": lambda arg, param_name, object_path: arg,
+    "reference": _reference_macro,
+}
 
 # Global macro substitution function
 def substitute_macros(text, param_name=None, object_path=None):
     if not text:
         return ""
 
-    def macro_replacer(match):
-        macro = match.group(1).strip()
-
-        if macro == "numentries":
-            if param_name and param_name.endswith("NumberOfEntries"):
-                table = param_name.replace("NumberOfEntries", "")
-                full_table = f"{object_path}{table}" if object_path else table
-                return f"The number of entries in the {full_table} table."
-            return "The number of entries."
-
-        if macro == "empty":
-            return "an empty string"
-
-        if macro == "pattern":
-            return "a valid value matching the required pattern"
-
-        if macro in ["reference", "referenceName", "noreference"]:
-            return ""
-
-        if macro.startswith("param|") or macro.startswith("object|") or macro.startswith("bibref|"):
-            return macro.split("|", 1)[1]
-
-        if macro.startswith("reference|"):
-            content = macro.split("|", 1)[1]
-            return content.replace("{{object}}", object_path.rstrip('.') if object_path else "this object")
-
-        return ""
+    def macro_replacer(macro):
+        name, sep, arg = macro.strip().partition("|")
+        handler = (_ARG_MACROS if sep else _PLAIN_MACROS).get(name)
+        return handler(arg, param_name, object_path) if handler else ""
 
     try:
-        result = re.sub(r"\{\{(.*?)\}\}", macro_replacer, text)
+        result = _expand_macros(text, macro_replacer)
     except Exception as e:
         print(f"Error replacing macros in text: {text[:50]}... -> {e}")
         result = text
@@ -218,9 +291,122 @@ def clean_text(text):
     if text is None:
         return ""
     # Replace multiple whitespaces and newlines with a single space
-    return re.sub(r'\s+', ' ', text).strip()
+    return _WS_RE.sub(' ', text).strip()
+
+def _format_size_parts(elem):
+    """Collect the size strings of every <size> below elem (used for hexBinary)."""
+    size_parts = []
+    for size in elem.iterfind(".//size"):
+        bounds = _format_bounds(size.get('minLength'), size.get('maxLength'))
+        if bounds:
+            size_parts.append(bounds)
+    return size_parts
+
+def _format_hexbinary(elem):
+    size_parts = _format_size_parts(elem)
+    return f"hexbinary({', '.join(size_parts)})" if size_parts else "hexbinary"
+
+def _format_type(data_type, size_elem, range_elem, is_list):
+    """
+    Format a string or integer syntax type with its <size>/<range> facet.
+
+    Ranges use square brackets for int, long and unsignedInt. Inside a list only
+    unsignedInt keeps square brackets and the other integer types use parentheses;
+    outside a list unsignedLong is shown without its range.
+    """
+    if data_type == 'string':
+        if size_elem is not None:
+            min_len = size_elem.get('minLength')
+            max_len = size_elem.get('maxLength')
+            if min_len and max_len:
+                return f"{data_type}({min_len}:{max_len})"
+            if max_len:
+                return f"{data_type}({max_len})"
+        return data_type
+    if range_elem is None:
+        return data_type
+    if data_type == 'unsignedint' or (not is_list and data_type in _BRACKETED_RANGE_TYPES):
+        open_br, close_br = "[", "]"
+    elif is_list:
+        open_br, close_br = "(", ")"
+    else:
+        return data_type
+    min_val = range_elem.get('minInclusive')
+    max_val = range_elem.get('maxInclusive')
+    if min_val and max_val:
+        return f"{data_type}{open_br}{min_val}:{max_val}{close_br}"
+    if min_val:
+        return f"{data_type}{open_br}{min_val}:{close_br}"
+    if max_val:
+        return f"{data_type}{open_br}:{max_val}{close_br}"
+    return data_type
+
+def _syntax_value(type_elem):
+    """Return the text of the last non-empty <value> child of a syntax type, or None."""
+    value = None
+    for value_elem in type_elem:
+        if _localname(value_elem.tag) == 'value':
+            if value_elem.text:
+                value = value_elem.text.strip()
+    return value
+
+# Handlers for the children of an inline <syntax>; each updates the shared syntax state
+def _handle_list_syntax(type_elem, tag_name, syntax):
+    syntax['is_list'] = True
+    syntax['size_elem'] = type_elem.find('.//size')
+    syntax['range_elem'] = type_elem.find('.//range')
+    # Also check if the list contains a hexbinary element
+    for child in type_elem:
+        if _localname(child.tag) == 'hexbinary':
+            syntax['data_type'] = 'hexbinary'
+            syntax['formatted_type'] = _format_hexbinary(child)
+            break
 
-def extract_parameter_data(param_elem, parent_object_name, references_dict, templates_dict, html_descriptions, xml_root):
+def _handle_sized_syntax(type_elem, tag_name, syntax):
+    syntax['data_type'] = tag_name
+    if not syntax['is_list']:
+        syntax['size_elem'] = type_elem.find('.//size')
+        syntax['range_elem'] = type_elem.find('.//range')
+    value = _syntax_value(type_elem)
+    if value is not None:
+        syntax['default'] = value
+
+def _handle_hexbinary_syntax(type_elem, tag_name, syntax):
+    syntax['data_type'] = tag_name
+    syntax['formatted_type'] = _format_hexbinary(type_elem)
+    value = _syntax_value(type_elem)
+    if value is not None:
+        syntax['default'] = value
+
+def _handle_other_syntax(type_elem, tag_name, syntax):
+    syntax['data_type'] = tag_name
+    value = _syntax_value(type_elem)
+    if value is not None:
+        syntax['default'] = value
+
+def _skip_syntax(type_elem, tag_name, syntax):
+    # <default> is read before dispatch; a <dataType> without ref carries no type
+    pass
+
+_SYNTAX_HANDLERS = {
+    'default': _skip_syntax,
+    'datatype': _skip_syntax,
+    'list': _handle_list_syntax,
+    'string': _handle_sized_syntax,
+    'int': _handle_sized_syntax,
+    'unsignedint': _handle_sized_syntax,
+    'long': _handle_sized_syntax,
+    'unsignedlong': _handle_sized_syntax,
+    'hexbinary': _handle_hexbinary_syntax
+}
+
+def _render_description(desc_elem, param_name=None, object_path=None):
+    """Text of a <description> element with macros substituted and whitespace collapsed."""
+    # Descriptions are almost always a single text node; only join itertext() for mixed content
+    text = desc_elem.text if len(desc_elem) == 0 else ''.join(desc_elem.itertext())
+    return clean_text(substitute_macros(text, param_name=param_name, object_path=object_path))
+
+def extract_parameter_data(param_elem, parent_object_name, references_dict, templates_dict, html_descriptions, html_descriptions_relaxed, datatype_index):
     """
     Extract data from a parameter element.
     
@@ -228,285 +414,124 @@ def extract_parameter_data(param_elem, parent_object_name, references_dict, temp
         param_elem: The parameter XML element
         parent_object_name: Name of the parent object
         references_dict: Dictionary containing all references
+        html_descriptions_relaxed: HTML descriptions keyed by path with {i} placeholders removed
+        datatype_index: Dictionary mapping dataType names to their elements
         
     Returns:
-        Dictionary containing parameter data
+        Row containing parameter data
     """
     # Extract basic attributes
     name = param_elem.get('name', '')
     access = param_elem.get('access', '')
     version = param_elem.get('version', '')
-    min_entries = param_elem.get('minEntries', '')
-    max_entries = param_elem.get('maxEntries', '')
     ref = param_elem.get('ref', '')
     template_ref = param_elem.get('template', '')
+    description = ''
+    data_type = ''
+    object_default = ''
     
     # Create sanitized full path (remove accidental double dots, trim leading/trailing dots)
     full_path = f"{parent_object_name.rstrip('.')}.{name}".replace(" ", "").strip(".").rstrip('.')
-    # Initialize parameter data (remove specified keys)
-    param_data = {
-        'Object Name': parent_object_name,
-        'Parameter Name': name,
-        'Full Path': full_path,
-        'Access': access,
-        'Version': version,
-        'Description': '',
-        'Data Type': '',
-        'Object Default': '',
-        'Is Object': False
-    }
 
     # Prefer HTML description lookup first (case-insensitive, normalized)
-    full_path = param_data.get('Full Path', '')
     normalized = normalize_path(full_path)
     if normalized in html_descriptions:
-        param_data['Description'] = html_descriptions[normalized]
+        description = html_descriptions[normalized]
     else:
         # Try relaxed matching by removing {i} placeholders
         relaxed = normalized.replace("{i}", "")
-        found = False
-        for key in html_descriptions.keys():
-            if relaxed == key.replace("{i}", ""):
-                param_data['Description'] = html_descriptions[key]
-                found = True
-                break
-        if not found:
+        if relaxed in html_descriptions_relaxed:
+            description = html_descriptions_relaxed[relaxed]
+        else:
             # Fallback to XML embedded description
             found_xml_desc = False
             for desc_elem in param_elem:
-                if 'description' in desc_elem.tag.lower():
-                    desc_text = ''.join(desc_elem.itertext())
-                    desc_text = substitute_macros(desc_text, param_name=name, object_path=parent_object_name)
-                    param_data['Description'] = clean_text(desc_text)
+                if _localname(desc_elem.tag) == 'description':
+                    description = _render_description(desc_elem, param_name=name, object_path=parent_object_name)
                     found_xml_desc = True
             if not found_xml_desc:
-                param_data['Description'] = "No HTML or XML description available"
+                description = "No HTML or XML description available"
     
     # Process syntax and data type, and extract Object Default if present
     for syntax_elem in param_elem:
-        if 'syntax' in syntax_elem.tag.lower():
+        if _localname(syntax_elem.tag) == 'syntax':
             # Always look for <dataType ref="..."> and resolve recursively
-            is_list = False
-            data_type = ''
-            formatted_type = ''
-            size_elem = None
-            range_elem = None
             datatype_ref_found = None
             # Look for default value in syntax or its children
-            default_found = False
             for type_elem in syntax_elem:
-                tag_name = type_elem.tag.split('}')[-1].lower()
+                tag_name = _localname(type_elem.tag)
                 if tag_name == 'default':
                     # Default value can be an attribute or text
                     value = type_elem.get('value')
                     if value is not None:
-                        param_data['Object Default'] = value
-                        default_found = True
+                        object_default = value
                     elif type_elem.text:
-                        param_data['Object Default'] = type_elem.text.strip()
-                        default_found = True
+                        object_default = type_elem.text.strip()
                     continue
                 if tag_name == 'datatype':
                     datatype_ref_found = type_elem.get('ref')
                     break
             if datatype_ref_found:
-                resolved_type = resolve_datatype_reference(datatype_ref_found, xml_root)
+                resolved_type = resolve_datatype_reference(datatype_ref_found, datatype_index)
                 if resolved_type:
-                    param_data['Data Type'] = resolved_type
+                    data_type = resolved_type
                 else:
-                    param_data['Data Type'] = f"ref({datatype_ref_found})"
+                    data_type = f"ref({datatype_ref_found})"
             else:
-                # Old logic for list, string, int, unsignedInt, hexBinary, etc.
-                for i, type_elem in enumerate(syntax_elem):
-                    tag_name = type_elem.tag.split('}')[-1].lower()
-                    if tag_name == 'default':
-                        # Already handled above
-                        continue
-                    if tag_name == 'list':
-                        is_list = True
-                        size_elem = type_elem.find('.//size')
-                        range_elem = type_elem.find('.//range')
-                        # Also check if the list contains a hexbinary element
-                        list_type_elem = None
-                        for child in type_elem:
-                            child_tag = child.tag.split('}')[-1].lower()
-                            if child_tag == 'hexbinary':
-                                list_type_elem = child
-                                break
-                        if list_type_elem is not None:
-                            data_type = 'hexbinary'
-                            # Aggregate all <size> tags for hexbinary list
-                            if data_type == 'hexbinary':
-                                sizes = list_type_elem.findall(".//size")
-                                size_parts = []
-                                for size in sizes:
-                                    min_len = size.get('minLength')
-                                    max_len = size.get('maxLength')
-                                    if min_len and max_len:
-                                        size_parts.append(f"{min_len}:{max_len}")
-                                    elif min_len:
-                                        size_parts.append(f"{min_len}:")
-                                    elif max_len:
-                                        size_parts.append(f"{max_len}")
-                                formatted_type = f"hexbinary({', '.join(size_parts)})" if size_parts else "hexbinary"
-                            else:
-                                formatted_type = data_type
-                            continue
-                    elif tag_name in ['string', 'int', 'unsignedint', 'long', 'unsignedlong']:
-                        data_type = tag_name
-                        if not is_list:
-                            size_elem = type_elem.find('.//size')
-                            range_elem = type_elem.find('.//range')
-                        # Try to find a <value> element for default
-                        for value_elem in type_elem:
-                            if 'value' in value_elem.tag.lower():
-                                if value_elem.text:
-                                    param_data['Object Default'] = value_elem.text.strip()
-                                    default_found = True
-                    elif tag_name == 'hexbinary':
-                        data_type = tag_name
-                        # Aggregate all <size> tags for hexbinary (non-list)
-                        if data_type == 'hexbinary':
-                            sizes = type_elem.findall(".//size")
-                            size_parts = []
-                            for size in sizes:
-                                min_len = size.get('minLength')
-                                max_len = size.get('maxLength')
-                                if min_len and max_len:
-                                    size_parts.append(f"{min_len}:{max_len}")
-                                elif min_len:
-                                    size_parts.append(f"{min_len}:")
-                                elif max_len:
-                                    size_parts.append(f"{max_len}")
-                            formatted_type = f"hexbinary({', '.join(size_parts)})" if size_parts else "hexbinary"
-                        else:
-                            formatted_type = data_type
-                        # Try to find a <value> element for default
-                        for value_elem in type_elem:
-                            if 'value' in value_elem.tag.lower():
-                                if value_elem.text:
-                                    param_data['Object Default'] = value_elem.text.strip()
-                                    default_found = True
-                    elif tag_name not in ['list', 'string', 'int', 'unsignedint', 'long', 'unsignedlong', 'datatype', 'hexbinary']:
-                        data_type = tag_name
-                        formatted_type = data_type
-                        # Try to find a <value> element for default
-                        for value_elem in type_elem:
-                            if 'value' in value_elem.tag.lower():
-                                if value_elem.text:
-                                    param_data['Object Default'] = value_elem.text.strip()
-                                    default_found = True
-                if is_list:
-                    if data_type == 'string':
-                        if size_elem is not None:
-                            min_len = size_elem.get('minLength')
-                            max_len = size_elem.get('maxLength')
-                            if min_len and max_len:
-                                formatted_type = f"{data_type}({min_len}:{max_len})"
-                            elif max_len:
-                                formatted_type = f"{data_type}({max_len})"
-                            else:
-                                formatted_type = data_type
-                        else:
-                            formatted_type = data_type
-                    elif data_type in ['int', 'unsignedint', 'long', 'unsignedlong']:
-                        if range_elem is not None:
-                            min_val = range_elem.get('minInclusive')
-                            max_val = range_elem.get('maxInclusive')
-                            if data_type == 'unsignedint':
-                                # Use square brackets for unsignedint
-                                if min_val and max_val:
-                                    formatted_type = f"{data_type}[{min_val}:{max_val}]"
-                                elif min_val:
-                                    formatted_type = f"{data_type}[{min_val}:]"
-                                elif max_val:
-                                    formatted_type = f"{data_type}[:{max_val}]"
-                                else:
-                                    formatted_type = data_type
-                            else:
-                                if min_val and max_val:
-                                    formatted_type = f"{data_type}({min_val}:{max_val})"
-                                elif min_val:
-                                    formatted_type = f"{data_type}({min_val}:)"
-                                elif max_val:
-                                    formatted_type = f"{data_type}(:{max_val})"
-                                else:
-                                    formatted_type = data_type
-                        else:
-                            formatted_type = data_type
-                    elif data_type == 'hexbinary':
-                        # formatted_type already set in loop above for hexbinary+list
-                        if not formatted_type:
-                            formatted_type = data_type
-                    else:
-                        formatted_type = data_type
+                # Inline list, string, int, unsignedInt, hexBinary, etc.
+                syntax = {
+                    'is_list': False,
+                    'data_type': '',
+                    'formatted_type': '',
+                    'size_elem': None,
+                    'range_elem': None,
+                    'default': None
+                }
+                for type_elem in syntax_elem:
+                    tag_name = _localname(type_elem.tag)
+                    _SYNTAX_HANDLERS.get(tag_name, _handle_other_syntax)(type_elem, tag_name, syntax)
+                if syntax['default'] is not None:
+                    object_default = syntax['default']
+                syntax_type = syntax['data_type']
+                if syntax_type in _SIZED_TYPES:
+                    data_type = _format_type(syntax_type, syntax['size_elem'], syntax['range_elem'], syntax['is_list'])
+                elif syntax_type == 'hexbinary':
+                    data_type = syntax['formatted_type']
                 else:
-                    if data_type == 'string':
-                        if size_elem is not None:
-                            min_len = size_elem.get('minLength')
-                            max_len = size_elem.get('maxLength')
-                            if min_len and max_len:
-                                formatted_type = f"{data_type}({min_len}:{max_len})"
-                            elif max_len:
-                                formatted_type = f"{data_type}({max_len})"
-                            else:
-                                formatted_type = data_type
-                        else:
-                            formatted_type = data_type
-                    elif data_type in ['int', 'unsignedint', 'long', 'unsignedlong']:
-                        if range_elem is not None:
-                            min_val = range_elem.get('minInclusive')
-                            max_val = range_elem.get('maxInclusive')
-                            if data_type in ['int', 'long', 'unsignedint']:
-                                # Use square brackets for int, long, and unsignedint
-                                if min_val and max_val:
-                                    formatted_type = f"{data_type}[{min_val}:{max_val}]"
-                                elif min_val:
-                                    formatted_type = f"{data_type}[{min_val}:]"
-                                elif max_val:
-                                    formatted_type = f"{data_type}[:{max_val}]"
-                                else:
-                                    formatted_type = data_type
-                            else:
-                                formatted_type = data_type
-                        else:
-                            formatted_type = data_type
-                    elif data_type == 'hexbinary':
-                        # formatted_type already set in loop above for hexbinary
-                        if not formatted_type:
-                            formatted_type = data_type
-                    else:
-                        if not formatted_type:
-                            formatted_type = data_type
-                param_data['Data Type'] = formatted_type if formatted_type else data_type
+                    data_type = syntax_type
     
-    # Process template if present
-    if template_ref:
-        # Apply template data
-        template_data = extract_template_data(template_ref, templates_dict)
-        if template_data:
-            # Only override if not already set
-            if not param_data['Description'] and template_data.get('description'):
-                param_data['Description'] = template_data['description']
-            if not param_data['Data Type'] and template_data.get('data_type'):
-                param_data['Data Type'] = template_data['data_type']
-            if not param_data['Object Default'] and template_data.get('default_value'):
-                param_data['Object Default'] = template_data['default_value']
-
-    # Process reference if present
-    if ref:
-        # Resolve reference to actual value
-        ref_data = resolve_reference(ref, references_dict)
-        if ref_data:
-            # Only override if not already set
-            if not param_data['Description']:
-                param_data['Description'] = ref_data.get('description', '')
-            if not param_data['Data Type']:
-                param_data['Data Type'] = ref_data.get('data_type', '')
-            if not param_data['Object Default']:
-                param_data['Object Default'] = ref_data.get('default_value', '')
-
-    return param_data
+    # Fill missing fields from the template, then the reference (skipped when all are set)
+    if (template_ref or ref) and not (description and data_type and object_default):
+        fallback_description, fallback_data_type, fallback_default = _parameter_fallbacks(
+            template_ref, ref, templates_dict, references_dict)
+        description = description or fallback_description
+        data_type = data_type or fallback_data_type
+        object_default = object_default or fallback_default
+
+    # Access, Version and Data Type take few distinct values; intern them so rows share one copy
+    return Row(parent_object_name, name, full_path, description, sys.intern(data_type), object_default, False,
+               sys.intern(access), sys.intern(version))
+
+# (template name, reference target) -> inherited (description, data_type, default_value)
+_fallback_cache = {}
+
+def _parameter_fallbacks(template_ref, ref, templates_dict, references_dict):
+    """
+    Fields a parameter inherits from its template and, where the template leaves
+    them empty, from its reference. Memoized per template and reference target; the
+    target is looked up on every call, so a reference added later is never missed.
+    """
+    key = (template_ref, references_dict.get(ref) if ref else None)
+    fallbacks = _fallback_cache.get(key)
+    if fallbacks is None:
+        template_data = extract_template_data(template_ref, templates_dict) if template_ref else None
+        ref_data = resolve_reference(ref, references_dict) if ref else None
+        template_data = template_data or {}
+        ref_data = ref_data or {}
+        fallbacks = _fallback_cache[key] = tuple(
+            template_data.get(field) or ref_data.get(field) or ''
+            for field in ('description', 'data_type', 'default_value'))
+    return fallbacks
 
 def resolve_reference(ref_name, references_dict):
     """
@@ -537,16 +562,11 @@ def extract_object_data(obj_elem, html_descriptions):
         html_descriptions: Dictionary mapping normalized full paths to HTML descriptions
         
     Returns:
-        Dictionary containing all extracted object information
+        Row containing the extracted object information
     """
-    # Define namespace
-    ns = {'dm': 'urn:broadband-forum-org:cwmp:datamodel-1-14'}
-    
     # Extract basic object attributes
     name = obj_elem.get('name', '')
     access = obj_elem.get('access', '')
-    min_entries = obj_elem.get('minEntries', '')
-    max_entries = obj_elem.get('maxEntries', '')
     version = obj_elem.get('version', '')
 
     # Prefer HTML description lookup first (case-insensitive, normalized)
@@ -557,19 +577,15 @@ def extract_object_data(obj_elem, html_descriptions):
     if normalized in html_descriptions:
         description = html_descriptions[normalized]
     else:
-        desc_elem = obj_elem.find('dm:description', ns)
+        # Scan the children directly rather than going through ElementPath
+        desc_elem = next((child for child in obj_elem if child.tag == DM_DESCRIPTION), None)
         description = clean_text(desc_elem.text) if desc_elem is not None and desc_elem.text else ""
     
-    # Return structured object data
-    return {
-        'Object Name': name,
-        'Access': access,
-        'Min Entries': min_entries,
-        'Max Entries': max_entries,
-        'Version': version,
-        'Description': description,
-        'Is Object': True
-    }
+    # Return structured object data (objects have no parameter-level columns)
+    return Row(name, None, None, description, None, None, True, sys.intern(access), sys.intern(version))
+
+# Resolved template data keyed by template name; reset for each XML file
+_template_cache = {}
 
 def extract_template_data(template_name, templates_dict):
     """
@@ -580,29 +596,24 @@ def extract_template_data(template_name, templates_dict):
         templates_dict: Dictionary containing all templates
         
     Returns:
-        Dictionary containing template data
+        Dictionary containing template data (a copy of the memoized result)
     """
-    # Look up the template in the templates dictionary
+    if template_name not in _template_cache:
+        _template_cache[template_name] = _resolve_template_data(template_name, templates_dict)
+    data = _template_cache[template_name]
+    return dict(data) if data is not None else None
+
+def _resolve_template_data(template_name, templates_dict):
+    # Look up the template in the templates dictionary; _inherit_templates has already
+    # filled its empty fields along its parent chain
     if template_name in templates_dict:
         template_data = templates_dict[template_name]
         # Only keep description and data_type (and default_value for param use)
-        data = {
+        return {
             'description': template_data.get('description', ''),
             'data_type': template_data.get('data_type', ''),
             'default_value': template_data.get('default_value', '')
         }
-        # Check if this template inherits from another template
-        parent_template = template_data.get('template', '')
-        if parent_template:
-            parent_data = extract_template_data(parent_template, templates_dict)
-            if parent_data:
-                if not data['description'] and parent_data.get('description'):
-                    data['description'] = parent_data['description']
-                if not data['data_type'] and parent_data.get('data_type'):
-                    data['data_type'] = parent_data['data_type']
-                if not data['default_value'] and parent_data.get('default_value'):
-                    data['default_value'] = parent_data['default_value']
-        return data
     return None
 
 def extract_template_data_from_xml(template_elem):
@@ -623,7 +634,7 @@ def extract_template_data_from_xml(template_elem):
     # Extract description
     description = ''
     for desc_elem in template_elem:
-        if 'description' in desc_elem.tag.lower():
+        if _localname(desc_elem.tag) == 'description':
             description = clean_text(desc_elem.text) if desc_elem.text else ''
             break
     
@@ -631,10 +642,10 @@ def extract_template_data_from_xml(template_elem):
     data_type = ''
     default_value = ''
     for syntax_elem in template_elem:
-        if 'syntax' in syntax_elem.tag.lower():
+        if _localname(syntax_elem.tag) == 'syntax':
             # Get the first child element of syntax - this is the data type
             for type_elem in syntax_elem:
-                data_type = type_elem.tag.split('}')[-1]  # Remove namespace
+                data_type = type_elem.tag.rsplit('}', 1)[-1]  # Remove namespace
                 
                 # Check for value attribute
                 value = type_elem.get('value', '')
@@ -643,7 +654,7 @@ def extract_template_data_from_xml(template_elem):
                 
                 # Check for default value in value element
                 for value_elem in type_elem:
-                    if 'value' in value_elem.tag.lower():
+                    if _localname(value_elem.tag) == 'value':
                         if value_elem.text:
                             default_value = value_elem.text
                 break
@@ -657,228 +668,309 @@ def extract_template_data_from_xml(template_elem):
         'default_value': default_value
     }
 
-def process_xml_file(xml_file_path, html_descriptions=None):
+def _extract_object_rows(obj_elem, references, templates, html_descriptions, html_descriptions_relaxed, datatype_index):
+    """Return the object's row followed by its parameter rows; empty for unnamed objects."""
+    rows = []
+    # Clean up objects with empty or '.' names (checked before doing any extraction)
+    object_name = obj_elem.get('name', '')
+    if not object_name or object_name.strip() == ".":
+        return rows
+    obj_data = extract_object_data(obj_elem, html_descriptions)
+    rows.append(obj_data)
+
+    # Process parameters within each object; their rows share the object row's name string
+    for param_elem in obj_elem:
+        if _localname(param_elem.tag) != 'parameter':
+            continue
+        # Clean up parameters with empty or '.' names or full paths
+        param_name = param_elem.get('name', '')
+        if not param_name or param_name.strip() == ".":
+            continue
+        param_data = extract_parameter_data(param_elem, obj_data.object_name, references, templates, html_descriptions, html_descriptions_relaxed, datatype_index)
+        if not param_data.full_path or param_data.full_path.strip() == ".":
+            continue
+        rows.append(param_data)
+    return rows
+
+def _collect_references(xml_file_path, references):
+    """
+    Collect the first top-level model's references into { ref_name: targetParamRef }.
+    References are interleaved with the objects that use them, so they get a pass
+    of their own before any object is extracted.
+    """
+    model = None
+    for event, elem in _iterparse(xml_file_path, ('{*}model', '{*}reference', '{*}object')):
+        tag_name = _localname(elem.tag)
+        if tag_name == 'model':
+            if event == 'start' and model is None and _is_top_level(elem):
+                model = elem
+            elif event == 'end' and elem is model:
+                return
+        elif event == 'end':
+            if tag_name == 'reference':
+                if model is not None:
+                    ref_name = elem.get('name', '')
+                    ref_target = elem.get('targetParamRef', '')
+                    if ref_name and ref_target:
+                        references[ref_name] = ref_target
+            else:
+                _release(elem)
+
+def _iter_document(xml_file_path, datatype_index, templates, counts):
+    """
+    Stream the document. dataTypes and top-level templates are collected into the
+    given dicts as they close; the objects of the first top-level model are yielded
+    as they close and released afterwards.
+
+    counts['model'] records whether that model was found and counts['objects'] how
+    many objects it contained.
+    """
+    model = None
+    for event, elem in _iterparse(xml_file_path, ('dataType', '{*}template', '{*}model', '{*}object')):
+        tag_name = _localname(elem.tag)
+        if tag_name == 'model':
+            # The first model element directly under the document root is processed
+            if event == 'start' and model is None and _is_top_level(elem):
+                model = elem
+                counts['model'] = True
+            elif event == 'end' and elem is model:
+                return
+            continue
+        if event == 'start':
+            continue
+        if tag_name == 'datatype':
+            # Index dataType definitions once so reference resolution is a dict lookup
+            if elem.get("name"):
+                datatype_index.setdefault(elem.get("name"), elem)
+        elif tag_name == 'template':
+            # Templates are direct children of the document root
+            if _is_top_level(elem):
+                template_data = extract_template_data_from_xml(elem)
+                if template_data['name']:
+                    templates[template_data['name']] = template_data
+        elif tag_name == 'object':
+            if model is not None:
+                counts['objects'] += 1
+                yield elem
+            _release(elem)
+
+def _inherit_templates(templates):
+    """
+    Fill empty template fields from their parent template. Templates are visited
+    parents first, so fields are inherited along whole chains of templates.
+    """
+    children = defaultdict(list)
+    roots = []
+    for template_name, template_data in templates.items():
+        parent_template = template_data['template']
+        if parent_template and parent_template in templates:
+            children[parent_template].append(template_name)
+        else:
+            roots.append(template_name)
+
+    queue = deque(roots)
+    while queue:
+        parent_data = templates[queue.popleft()]
+        for child_name in children.get(parent_data['name'], ()):
+            template_data = templates[child_name]
+            # Only override if not already set
+            for key in ('description', 'data_type', 'default_value'):
+                if not template_data[key] and parent_data[key]:
+                    template_data[key] = parent_data[key]
+            queue.append(child_name)
+
+class XMLProcessingError(Exception):
+    """Raised by process_xml_file after it has reported why the XML could not be processed."""
+
+def process_xml_file(xml_file_path, html_descriptions=None, html_descriptions_relaxed=None):
     """
     Process XML file to extract objects, parameters, templates, and references.
     
     Args:
         xml_file_path: Path to the XML file to process
+        html_descriptions: Dictionary mapping normalized full paths to HTML descriptions
+        html_descriptions_relaxed: Same descriptions keyed with {i} removed
+            (built from html_descriptions when not given)
         
-    Returns:
-        List of dictionaries containing all extracted data
+    Yields:
+        Rows (see Row) as each object is processed
+
+    Errors are reported and then raised as XMLProcessingError, so a consumer never
+    mistakes the rows streamed before a failure for the complete model.
     """
-    all_data = []
+    total = 0
     templates = {}
     references = {}
     if html_descriptions is None:
         html_descriptions = {}
+    if html_descriptions_relaxed is None:
+        html_descriptions_relaxed = relax_descriptions(html_descriptions)
     
     try:
         print(f"Processing XML file: {xml_file_path}")
-        # Parse XML file
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
-
-        # Find the model element
-        model = None
-        for elem in root:
-            if 'model' in elem.tag.lower():
-                model = elem
-                break
-
-        if model is None:
+        # Gather the model's references first, then stream the document extracting each
+        # object. Only the <dataType> elements (needed for reference resolution) stay in
+        # memory; each object is released once it has been processed.
+        datatype_index = {}
+        _datatype_cache.clear()
+        _template_cache.clear()
+        _fallback_cache.clear()
+        normalize_path.cache_clear()
+        counts = {'model': False, 'objects': 0}
+        _collect_references(xml_file_path, references)
+        objects = _iter_document(xml_file_path, datatype_index, templates, counts)
+
+        # dataTypes and templates precede the model, so they are complete once its first object closes
+        first_object = next(objects, None)
+        _inherit_templates(templates)
+
+        if first_object is not None:
+            objects = itertools.chain([first_object], objects)
+            # Process each object and its parameters
+            extract_args = (references, templates, html_descriptions, html_descriptions_relaxed)
+            for obj_elem in objects:
+                rows = _extract_object_rows(obj_elem, *extract_args, datatype_index)
+                total += len(rows)
+                yield from rows
+
+        if not counts['model']:
             print("Error: Could not find model element in XML")
-            return all_data
-
-        # Extract templates and resolve inheritance
-        # Extract all templates from XML (they are direct children of root)
-        templates_found = []
-        for elem in root:
-            if 'template' in elem.tag.lower():
-                templates_found.append(elem)
-
-        # First pass: Extract all template data from XML
-        for template in templates_found:
-            template_data = extract_template_data_from_xml(template)
-            if template_data['name']:
-                templates[template_data['name']] = template_data
-
-        # Second pass: Process template inheritance
-        for template_name, template_data in templates.items():
-            if template_data['template']:
-                parent_template = template_data['template']
-                if parent_template in templates:
-                    parent_data = templates[parent_template]
-                    # Only override if not already set
-                    if not template_data['description'] and parent_data['description']:
-                        template_data['description'] = parent_data['description']
-                    if not template_data['data_type'] and parent_data['data_type']:
-                        template_data['data_type'] = parent_data['data_type']
-                    if not template_data['default_value'] and parent_data['default_value']:
-                        template_data['default_value'] = parent_data['default_value']
-
-        # references = { ref_name: targetParamRef }
-        # Extract all references from XML (they are in the model element)
-        references_found = []
-        for elem in model.iter():
-            if 'reference' in elem.tag.lower():
-                references_found.append(elem)
-        for ref in references_found:
-            ref_name = ref.get('name', '')
-            ref_target = ref.get('targetParamRef', '')
-            if ref_name and ref_target:
-                references[ref_name] = ref_target
-
-        # Process all objects and their parameters (they are in the model element)
-        objects_found = []
-        for elem in model.iter():
-            if 'object' in elem.tag.lower():
-                objects_found.append(elem)
+            return
 
         print(f"Parsed {len(templates)} templates.")
         print(f"Parsed {len(references)} references.")
-        print(f"Parsed {len(objects_found)} objects.")
-
-        for obj_elem in objects_found:
-            obj_data = extract_object_data(obj_elem, html_descriptions)
-            # Clean up objects with empty or '.' names
-            if not obj_data['Object Name'] or obj_data['Object Name'].strip() == ".":
-                continue
-            all_data.append(obj_data)
-
-            # Process parameters within each object
-            parameters_found = []
-            for elem in obj_elem:
-                if 'parameter' in elem.tag.lower():
-                    parameters_found.append(elem)
-
-            for param_elem in parameters_found:
-                param_data = extract_parameter_data(param_elem, obj_data['Object Name'], references, templates, html_descriptions, root)
-                # Clean up parameters with empty or '.' names or full paths
-                if not param_data['Parameter Name'] or param_data['Parameter Name'].strip() == ".":
-                    continue
-                if not param_data['Full Path'] or param_data['Full Path'].strip() == ".":
-                    continue
-                all_data.append(param_data)
-
-        print(f"Total entries processed: {len(all_data)}")
+        print(f"Parsed {counts['objects']} objects.")
+        print(f"Total entries processed: {total}")
 
     except ET.ParseError as e:
         print(f"Error parsing XML: {e}")
+        raise XMLProcessingError(e) from e
     except Exception as e:
         print(f"Error processing XML: {e}")
         import traceback
         print(f"Full error traceback:\n{traceback.format_exc()}")
-
-    return all_data
+        raise XMLProcessingError(e) from e
 
 def create_excel(data, output_path):
     """
     Create Excel file from extracted data.
     
     Args:
-        data: List of dictionaries containing the data to export
+        data: Iterable of rows (see Row) containing the data to export
         output_path: Path where the Excel file should be saved
+
+    The workbook is written to a temporary file next to output_path and only moved
+    into place once every row has been written; if reading data fails, nothing is
+    left behind and an existing file at output_path is kept. XML errors have
+    already been reported by process_xml_file.
     """
-    if not data:
+    rows = iter(data)
+    try:
+        first_row = next(rows, None)
+    except XMLProcessingError:
+        return
+    if first_row is None:
         print("No data to export")
         return
-    
-    # Define column order for Excel output (remove specified columns)
-    columns_order = [
-        'Object Name', 'Parameter Name', 'Full Path',
-        'Description', 'Data Type', 'Object Default', 'Is Object',
-        'Access', 'Version'
-    ]
-    # Create DataFrame and save to Excel
-    df = pd.DataFrame(data, columns=columns_order)
-    
+
+    temp_path = f"{output_path}.tmp"
     try:
-        df.to_excel(output_path, index=False, engine='openpyxl')
+        # Stream the rows into the workbook in order, formatting object rows as they are written.
+        # Values are always written as plain strings, never as formulas or hyperlinks.
+        wb = xlsxwriter.Workbook(temp_path, {'constant_memory': True,
+                                             'strings_to_formulas': False,
+                                             'strings_to_urls': False})
+        try:
+            ws = wb.add_worksheet('Sheet1')
+            # Highlight object rows in Excel (light blue fill)
+            object_format = wb.add_format({'pattern': 1, 'bg_color': '#D9EAF7'})
+            ws.write_row(0, 0, COLUMNS)
+            for row_idx, row in enumerate(itertools.chain([first_row], rows), start=1):
+                ws.write_row(row_idx, 0, row, object_format if row.is_object else None)
+        finally:
+            # Also removes xlsxwriter's temporary row files
+            wb.close()
+        os.replace(temp_path, output_path)
         print(f"Excel file created successfully: {output_path}")
-        # Highlight object rows in Excel (light blue fill)
-        from openpyxl import load_workbook
-        from openpyxl.styles import PatternFill
-
-        # Load workbook and access sheet
-        wb = load_workbook(output_path)
-        ws = wb.active
-
-        # Define fill style for object rows
-        object_fill = PatternFill(start_color="D9EAF7", end_color="D9EAF7", fill_type="solid")
-
-        # Iterate over rows and apply fill to object rows
-        is_object_col_idx = columns_order.index('Is Object') + 1
-        for row_idx in range(2, ws.max_row + 1):  # Skip header row
-            is_object = ws.cell(row=row_idx, column=is_object_col_idx).value
-            if is_object:
-                for col_idx in range(1, len(columns_order) + 1):
-                    ws.cell(row=row_idx, column=col_idx).fill = object_fill
-
-        # Save the updated workbook
-        wb.save(output_path)
     except Exception as e:
-        print(f"Error creating Excel file: {e}")
+        if not isinstance(e, XMLProcessingError):
+            print(f"Error creating Excel file: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+# Lookups into the TR-181 HTML description document
+_DM_TABLE_XPATH = ET.XPath("(//table[contains(concat(' ', normalize-space(@class), ' '), ' data-model-table ')])[1]")
+_TEXT_NODES_XPATH = ET.XPath(".//text()")
+# Elements whose end starts a new line in a description
+_LINE_BREAK_TAGS = frozenset(("br", "li", "p"))
+_NL_RE = re.compile(r'\n+')
+
+def _html_to_text(cell):
+    """Plain text of an HTML description cell, one line per <br>, <li> and <p>."""
+    parts = []
+    def walk(elem):
+        if elem.text:
+            parts.append(elem.text)
+        for child in elem:
+            # Comments and processing instructions contribute only their tail
+            if isinstance(child.tag, str):
+                walk(child)
+                if child.tag in _LINE_BREAK_TAGS:
+                    parts.append("\n")
+            if child.tail:
+                parts.append(child.tail)
+    walk(cell)
+    return _NL_RE.sub('\n', "".join(parts)).strip()
 
 def main():
     # Get the directory where the script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
-    from bs4 import NavigableString
-    def extract_description(cells, desc_index):
-        def convert_html_to_text(html_fragment):
-            soup = BeautifulSoup(html_fragment, "html.parser")
-            for br in soup.find_all(["br", "li", "p"]):
-                br.insert_after("\n")
-            text = soup.get_text()
-            return re.sub(r'\n+', '\n', text).strip()
+    def get_text(elem):
+        """Text of an element with each text node stripped, as in a table's name cells."""
+        return "".join(text.strip() for text in _TEXT_NODES_XPATH(elem))
 
+    def extract_description(cells, desc_index):
         if len(cells) > desc_index:
-            raw_html = cells[desc_index].decode_contents()
+            cell = cells[desc_index]
         elif len(cells) >= 2:
-            raw_html = cells[1].decode_contents()
+            cell = cells[1]
         else:
             return ""
 
-        return convert_html_to_text(raw_html)
+        return _html_to_text(cell)
 
     # Load HTML description lookup table from HTML file
     html_descriptions = {}
-    html_path = None
-    for root, _, files in os.walk(script_dir):
-        for filename in fnmatch.filter(files, "tr-181*.html"):
-            html_path = os.path.join(root, filename)
-            break
-        if html_path:
-            break
+    html_path = next(Path(script_dir).rglob("tr-181*.html"), None)
 
-    if html_path and os.path.exists(html_path):
+    if html_path is not None:
         print(f"Found HTML file at: {html_path}")
-        with open(html_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, 'html.parser')
+        doc = lh.parse(html_path, parser=lh.HTMLParser(encoding='utf-8')).getroot()
         # New structure-aware HTML parsing logic
-        table = soup.find("table", class_="data-model-table")
-        if table:
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
+        tables = _DM_TABLE_XPATH(doc)
+        if tables:
+            table = tables[0]
+            headers = [get_text(th) for th in table.iter("th")]
             desc_index = headers.index("Description") if "Description" in headers else 1
-            rows = table.find_all("tr")
+            rows = table.iter("tr")
         else:
-            rows = soup.find_all("tr")
+            rows = doc.iter("tr")
             headers = []
             desc_index = 1
 
         last_object_path = ""
 
         for tr in rows:
-            classes = tr.get("class", [])
+            classes = tr.get("class", "").split()
             if not classes or ("object" not in classes and "parameter" not in classes):
                 continue
 
-            cells = tr.find_all("td")
+            cells = list(tr.iter("td"))
             if len(cells) == 0:
                 continue
 
-            name = cells[0].get_text(strip=True)
+            name = get_text(cells[0])
             if not name:
                 continue
 
@@ -891,7 +983,7 @@ def main():
             if "object" in classes:
                 if not name.endswith("."):
                     name += "."
-                last_object_path = name
+                last_object_path = sys.intern(name)
                 full_path = name
             else:
                 if not last_object_path:
@@ -909,9 +1001,9 @@ def main():
 
     # Process XML and create Excel
     print(f"Processing XML file: {input_file}")
-    data = process_xml_file(input_file, html_descriptions=html_descriptions)
-    print(f"Found {len(data)} entries")
-
+    # Rows are streamed from the XML straight into the workbook
+    data = process_xml_file(input_file, html_descriptions=html_descriptions,
+                            html_descriptions_relaxed=relax_descriptions(html_descriptions))
     create_excel(data, output_file)
 
 if __name__ == "__main__":